@@ -0,0 +1,154 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""
+_md5_ext.pyx.
+
+Optional compiled MD5 compression function for md5.py.
+
+The 64 steps are written out in C with one macro per round function, so every message index,
+rotation amount and sine constant is a literal and the C compiler can turn ROTL32 into a single
+rotate instruction and fold each a + f + M + K sum into LEA/ADD chains.
+
+Build it in place (from the src directory) with:
+
+    CFLAGS="-O3 -march=native" cythonize -i _md5_ext.pyx
+
+md5.py uses it automatically when it can be imported and falls back to Python otherwise: compress()
+handles a single chunk and compress_blocks() a whole buffer of chunks in one call.
+"""
+
+from libc.stdint cimport uint32_t
+
+cdef extern from *:
+    """
+    #include <stdint.h>
+    #include <string.h>
+
+    #define ROTL32(x, s) (((x) << (s)) | ((x) >> (32 - (s))))
+
+    /* G uses the GOpt form: the two terms have disjoint bits, so '|' can be '+'. */
+    #define F_STEP(a, b, c, d, m, k, s) a = b + ROTL32(a + ((b & c) | (~b & d)) + (m) + (k), s)
+    #define G_STEP(a, b, c, d, m, k, s) a = b + ROTL32(a + (d & b) + (~d & c) + (m) + (k), s)
+    #define H_STEP(a, b, c, d, m, k, s) a = b + ROTL32(a + (b ^ c ^ d) + (m) + (k), s)
+    #define I_STEP(a, b, c, d, m, k, s) a = b + ROTL32(a + (c ^ (b | ~d)) + (m) + (k), s)
+
+    static void md5_compress_block(uint32_t state[4], const unsigned char *block)
+    {
+        uint32_t M[16];
+        uint32_t a = state[0], b = state[1], c = state[2], d = state[3];
+
+    #if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+        memcpy(M, block, 64);
+    #else
+        for (int i = 0; i < 16; i++) {
+            M[i] = (uint32_t)block[4 * i] | ((uint32_t)block[4 * i + 1] << 8) |
+                   ((uint32_t)block[4 * i + 2] << 16) | ((uint32_t)block[4 * i + 3] << 24);
+        }
+    #endif
+
+        F_STEP(a, b, c, d, M[0], 0xd76aa478, 7);   F_STEP(d, a, b, c, M[1], 0xe8c7b756, 12);
+        F_STEP(c, d, a, b, M[2], 0x242070db, 17);  F_STEP(b, c, d, a, M[3], 0xc1bdceee, 22);
+        F_STEP(a, b, c, d, M[4], 0xf57c0faf, 7);   F_STEP(d, a, b, c, M[5], 0x4787c62a, 12);
+        F_STEP(c, d, a, b, M[6], 0xa8304613, 17);  F_STEP(b, c, d, a, M[7], 0xfd469501, 22);
+        F_STEP(a, b, c, d, M[8], 0x698098d8, 7);   F_STEP(d, a, b, c, M[9], 0x8b44f7af, 12);
+        F_STEP(c, d, a, b, M[10], 0xffff5bb1, 17); F_STEP(b, c, d, a, M[11], 0x895cd7be, 22);
+        F_STEP(a, b, c, d, M[12], 0x6b901122, 7);  F_STEP(d, a, b, c, M[13], 0xfd987193, 12);
+        F_STEP(c, d, a, b, M[14], 0xa679438e, 17); F_STEP(b, c, d, a, M[15], 0x49b40821, 22);
+
+        G_STEP(a, b, c, d, M[1], 0xf61e2562, 5);   G_STEP(d, a, b, c, M[6], 0xc040b340, 9);
+        G_STEP(c, d, a, b, M[11], 0x265e5a51, 14); G_STEP(b, c, d, a, M[0], 0xe9b6c7aa, 20);
+        G_STEP(a, b, c, d, M[5], 0xd62f105d, 5);   G_STEP(d, a, b, c, M[10], 0x02441453, 9);
+        G_STEP(c, d, a, b, M[15], 0xd8a1e681, 14); G_STEP(b, c, d, a, M[4], 0xe7d3fbc8, 20);
+        G_STEP(a, b, c, d, M[9], 0x21e1cde6, 5);   G_STEP(d, a, b, c, M[14], 0xc33707d6, 9);
+        G_STEP(c, d, a, b, M[3], 0xf4d50d87, 14);  G_STEP(b, c, d, a, M[8], 0x455a14ed, 20);
+        G_STEP(a, b, c, d, M[13], 0xa9e3e905, 5);  G_STEP(d, a, b, c, M[2], 0xfcefa3f8, 9);
+        G_STEP(c, d, a, b, M[7], 0x676f02d9, 14);  G_STEP(b, c, d, a, M[12], 0x8d2a4c8a, 20);
+
+        H_STEP(a, b, c, d, M[5], 0xfffa3942, 4);   H_STEP(d, a, b, c, M[8], 0x8771f681, 11);
+        H_STEP(c, d, a, b, M[11], 0x6d9d6122, 16); H_STEP(b, c, d, a, M[14], 0xfde5380c, 23);
+        H_STEP(a, b, c, d, M[1], 0xa4beea44, 4);   H_STEP(d, a, b, c, M[4], 0x4bdecfa9, 11);
+        H_STEP(c, d, a, b, M[7], 0xf6bb4b60, 16);  H_STEP(b, c, d, a, M[10], 0xbebfbc70, 23);
+        H_STEP(a, b, c, d, M[13], 0x289b7ec6, 4);  H_STEP(d, a, b, c, M[0], 0xeaa127fa, 11);
+        H_STEP(c, d, a, b, M[3], 0xd4ef3085, 16);  H_STEP(b, c, d, a, M[6], 0x04881d05, 23);
+        H_STEP(a, b, c, d, M[9], 0xd9d4d039, 4);   H_STEP(d, a, b, c, M[12], 0xe6db99e5, 11);
+        H_STEP(c, d, a, b, M[15], 0x1fa27cf8, 16); H_STEP(b, c, d, a, M[2], 0xc4ac5665, 23);
+
+        I_STEP(a, b, c, d, M[0], 0xf4292244, 6);   I_STEP(d, a, b, c, M[7], 0x432aff97, 10);
+        I_STEP(c, d, a, b, M[14], 0xab9423a7, 15); I_STEP(b, c, d, a, M[5], 0xfc93a039, 21);
+        I_STEP(a, b, c, d, M[12], 0x655b59c3, 6);  I_STEP(d, a, b, c, M[3], 0x8f0ccc92, 10);
+        I_STEP(c, d, a, b, M[10], 0xffeff47d, 15); I_STEP(b, c, d, a, M[1], 0x85845dd1, 21);
+        I_STEP(a, b, c, d, M[8], 0x6fa87e4f, 6);   I_STEP(d, a, b, c, M[15], 0xfe2ce6e0, 10);
+        I_STEP(c, d, a, b, M[6], 0xa3014314, 15);  I_STEP(b, c, d, a, M[13], 0x4e0811a1, 21);
+        I_STEP(a, b, c, d, M[4], 0xf7537e82, 6);   I_STEP(d, a, b, c, M[11], 0xbd3af235, 10);
+        I_STEP(c, d, a, b, M[2], 0x2ad7d2bb, 15);  I_STEP(b, c, d, a, M[9], 0xeb86d391, 21);
+
+        state[0] += a;
+        state[1] += b;
+        state[2] += c;
+        state[3] += d;
+    }
+    """
+    void md5_compress_block(uint32_t state[4], const unsigned char *block) nogil
+
+
+def compress(const unsigned char[::1] chunk, uint32_t state_a, uint32_t state_b, uint32_t state_c, uint32_t state_d):
+    """
+    Process a 64-byte chunk of data, updating the MD5 hash state.
+
+    Arguments:
+        chunk (bytes): A 64-byte chunk of the message to be processed (any contiguous buffer).
+        state_a (int): The current state value A.
+        state_b (int): The current state value B.
+        state_c (int): The current state value C.
+        state_d (int): The current state value D.
+
+    Returns:
+        tuple[int, int, int, int]: Updated state values (A, B, C, D) after processing the chunk.
+
+    Raises:
+        ValueError: If the chunk is not exactly 64 bytes long.
+    """
+    cdef uint32_t state[4]
+
+    if chunk.shape[0] != 64:
+        raise ValueError("MD5 chunks must be exactly 64 bytes long.")
+
+    state[0] = state_a
+    state[1] = state_b
+    state[2] = state_c
+    state[3] = state_d
+    md5_compress_block(state, &chunk[0])
+    return state[0], state[1], state[2], state[3]
+
+
+def compress_blocks(const unsigned char[::1] data, uint32_t state_a, uint32_t state_b, uint32_t state_c, uint32_t state_d):
+    """
+    Process every 64-byte block of a buffer, updating the MD5 hash state.
+
+    Arguments:
+        data (bytes): The data to be processed (any contiguous buffer); its length must be a multiple of 64.
+        state_a (int): The current state value A.
+        state_b (int): The current state value B.
+        state_c (int): The current state value C.
+        state_d (int): The current state value D.
+
+    Returns:
+        tuple[int, int, int, int]: Updated state values (A, B, C, D) after processing every block.
+
+    Raises:
+        ValueError: If the length of the data is not a multiple of 64 bytes.
+    """
+    cdef uint32_t state[4]
+    cdef Py_ssize_t offset
+
+    if data.shape[0] % 64:
+        raise ValueError("MD5 data must be a multiple of 64 bytes long.")
+
+    state[0] = state_a
+    state[1] = state_b
+    state[2] = state_c
+    state[3] = state_d
+    with nogil:
+        for offset in range(0, data.shape[0], 64):
+            md5_compress_block(state, &data[offset])
+    return state[0], state[1], state[2], state[3]
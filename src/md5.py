@@ -9,19 +9,55 @@ and state manipulation, all in line with the MD5 specification.
 
 Modules:
     - left_rotate: Function for left rotating a 32-bit integer.
-    - process_md5_chunk: Function to process each 64-byte chunk of the message.
+    - process_md5_chunk: Reference (loop-based) function to process one 64-byte chunk of the message.
+    - emit_unrolled_steps: Function to emit the source lines of the 64 unrolled MD5 steps, folding values known at generation time.
+    - generate_unrolled_compress_source: Function to emit the source of a fully unrolled 64-step compression function.
+    - generate_fixed_length_source: Function to emit the source of an MD5 function specialised to one message length.
+    - get_chunk_compressor: Function to select the fastest available chunk compression function.
+    - compress_blocks: Function to compress every 64-byte block of a buffer in one pass.
     - apply_md5_padding: Function to apply MD5 padding to the input data.
+    - open_uring: Function to create an io_uring instance for reading files, when io_uring is usable.
+    - read_file_blocks_uring: Generator function to read the start of a file in 64-byte blocks through io_uring.
+    - FileChunkReader: Class to read a file as 64-byte chunks, keeping the trailing partial chunk for padding.
     - read_file_in_chunks: Generator function to read a file in 64-byte chunks.
+    - ensure_bytes: Function to convert string input to bytes and validate the input type.
     - process_data: Function to handle data input, whether from a file or a string, and apply padding.
+    - hashlib_md5: Function to compute the MD5 hash of a string or file using the standard library backend.
     - md5: Main function to compute the MD5 hash of a given input string or file.
+    - md5_many: Function to compute the MD5 hashes of many independent inputs, lane-parallel when numba is installed.
+    - make_md5_fixed_len: Function to build (and memoize) an MD5 function for a fixed short message length.
+    - md5_small: Function to compute the MD5 hash of a short input through the fixed-length functions.
     - format_md5: Function to format the final MD5 hash in hexadecimal format.
 """
 
+# pylint: disable=too-many-lines
+
 import os
 import struct
+import hashlib
 import argparse
+import functools
+
+from typing import Callable, Generator, List, Union
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    HAVE_NUMBA = False
+
+try:
+    from _md5_ext import compress as md5_ext_compress, compress_blocks as md5_ext_compress_blocks
+    HAVE_MD5_EXT = True
+except ImportError:  # pragma: no cover - the C extension is optional and built separately
+    HAVE_MD5_EXT = False
 
-from typing import Generator, Union
+try:
+    import liburing
+    HAVE_LIBURING = True
+except ImportError:  # pragma: no cover - liburing is an optional Linux-only I/O backend
+    HAVE_LIBURING = False
 
 
 # Initial MD5 hash values
@@ -31,15 +67,50 @@ INITIAL_STATE_C = 0x98badcfe
 INITIAL_STATE_D = 0x10325476
 
 # MD5 Rotation amounts
-ROTATION_AMOUNTS = [
+ROTATION_AMOUNTS = (
     7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
     5,  9, 14, 20, 5,  9, 14, 20, 5,  9, 14, 20, 5,  9, 14, 20,
     4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
     6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21
-]
+)
 
 # Precomputed sine function constants
-SINE_CONSTANTS = [int(4294967296 * abs(__import__('math').sin(i + 1))) & 0xFFFFFFFF for i in range(64)]
+SINE_CONSTANTS = tuple(int(4294967296 * abs(__import__('math').sin(i + 1))) & 0xFFFFFFFF for i in range(64))
+
+# Precompiled layout of a 64-byte chunk as 16 little-endian 32-bit words
+MESSAGE_STRUCT = struct.Struct('<16I')
+
+# Number of bytes requested from the operating system per read when hashing a file
+FILE_READ_SIZE = 1 << 20
+
+# Number of reads kept in flight, and the size of each read buffer, when reading a file through io_uring
+URING_QUEUE_DEPTH = 8
+URING_BUFFER_SIZE = 256 * 1024
+
+# Setting this environment variable to a non-empty value makes md5() use the hashlib backend
+HASHLIB_ENV_VAR = 'MD5_USE_HASHLIB'
+
+# Block size used when streaming files through the hashlib backend
+HASHLIB_READ_SIZE = 1 << 20
+
+# Messages shorter than this are not worth the one-off numba compile and use the plain unrolled function
+NUMBA_MIN_LENGTH = 4 << 20
+
+# Number of independent messages (lanes) handled together by one parallel work item in md5_many
+MD5_MANY_LANE_GROUP = 64
+
+# Maximum number of messages (lanes) md5_many packs into one lane matrix
+MD5_MANY_BATCH_SIZE = 4096
+
+# A lane matrix holds messages of at most this many times the block count of its shortest message,
+# which bounds the zero-padding of the shorter lanes
+MD5_MANY_MAX_PADDING_RATIO = 2
+
+
+if HAVE_NUMBA:
+    # uint32 copies of the constant tables, captured as globals by the compiled lane kernel
+    ROTATION_AMOUNTS_U32 = np.array(ROTATION_AMOUNTS, dtype=np.uint32)
+    SINE_CONSTANTS_U32 = np.array(SINE_CONSTANTS, dtype=np.uint32)
 
 
 class MD5Exception(Exception):
@@ -51,7 +122,9 @@ def left_rotate(value: int, shift_amount: int) -> int:
     Perform a left circular rotation on a 32-bit integer by a specified number of bits.
 
     This is a helper function used in the MD5 algorithm to shift the bits of an integer
-    to the left, with the bits wrapping around to the right side.
+    to the left, with the bits wrapping around to the right side. The hashing paths inline
+    this expression rather than paying for a function call per step; it is kept as a public
+    helper for backward compatibility.
 
     Arguments:
         value (int): The integer to be rotated.
@@ -71,8 +144,13 @@ def process_md5_chunk(chunk: bytes, state_a: int, state_b: int, state_c: int, st
     transformations based on the MD5 algorithm. It uses four auxiliary functions (F, G, H, I)
     and predefined constants to modify the input state variables.
 
+    This is the readable reference implementation of the compression function; md5() does not
+    call it. Hashing goes through compress_blocks(), which uses the _md5_ext extension, the
+    numba block-array kernel or the generated unrolled function, all of which must agree with
+    this function for every chunk and state.
+
     Arguments:
-        chunk (bytes): A 64-byte chunk of the message to be processed.
+        chunk (bytes): A 64-byte chunk of the message to be processed (any bytes-like object, e.g. a memoryview).
         state_a (int): The current state value A.
         state_b (int): The current state value B.
         state_c (int): The current state value C.
@@ -81,27 +159,398 @@ def process_md5_chunk(chunk: bytes, state_a: int, state_b: int, state_c: int, st
     Returns:
         tuple[int, int, int, int]: Updated state values (A, B, C, D) after processing the chunk.
     """
-    message_schedule = struct.unpack('<16I', chunk)
+    S = ROTATION_AMOUNTS
+    K = SINE_CONSTANTS
+
+    message_schedule = MESSAGE_STRUCT.unpack_from(chunk)
     a, b, c, d = state_a, state_b, state_c, state_d
 
+    # Round 1: F
+    for i in range(16):
+        temp = (a + ((b & c) | (~b & d)) + message_schedule[i] + K[i]) & 0xFFFFFFFF
+        s = S[i]
+        a, b, c, d = d, (b + (((temp << s) | (temp >> (32 - s))) & 0xFFFFFFFF)) & 0xFFFFFFFF, b, c
+
+    # Round 2: G, in the GOpt form (the two terms have disjoint bits, so '|' can be '+' and both join the main sum independently)
+    for i in range(16, 32):
+        temp = (a + (d & b) + (~d & c) + message_schedule[(5 * i + 1) % 16] + K[i]) & 0xFFFFFFFF
+        s = S[i]
+        a, b, c, d = d, (b + (((temp << s) | (temp >> (32 - s))) & 0xFFFFFFFF)) & 0xFFFFFFFF, b, c
+
+    # Round 3: H
+    for i in range(32, 48):
+        temp = (a + (b ^ c ^ d) + message_schedule[(3 * i + 5) % 16] + K[i]) & 0xFFFFFFFF
+        s = S[i]
+        a, b, c, d = d, (b + (((temp << s) | (temp >> (32 - s))) & 0xFFFFFFFF)) & 0xFFFFFFFF, b, c
+
+    # Round 4: I. Not (b & ~d) | (c & d): that selects between b and c and differs from I (e.g. for b = c = d = 0).
+    # ~d does not depend on b, so only the '|' and '^' sit on the dependency chain already.
+    for i in range(48, 64):
+        temp = (a + (c ^ (b | ~d)) + message_schedule[(7 * i) % 16] + K[i]) & 0xFFFFFFFF
+        s = S[i]
+        a, b, c, d = d, (b + (((temp << s) | (temp >> (32 - s))) & 0xFFFFFFFF)) & 0xFFFFFFFF, b, c
+
+    return (state_a + a) & 0xFFFFFFFF, (state_b + b) & 0xFFFFFFFF, (state_c + c) & 0xFFFFFFFF, (state_d + d) & 0xFFFFFFFF
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _md5_compress_lanes(words, block_counts, state):  # pragma: no cover  # pylint: disable=too-many-locals,too-many-branches
+        """
+        Compress many independent MD5 streams in lockstep, one lane per message.
+
+        Lanes are split into groups of MD5_MANY_LANE_GROUP which are spread across threads with
+        prange. Within a group every step is a loop over the lanes of uint32 arrays, which LLVM
+        turns into SIMD and/or/xor/add/shift instructions, and the a, b, c, d arrays are renamed
+        rather than copied after each step. Lanes past the end of their message still run (on
+        zero words) but their state is left untouched.
+
+        Arguments:
+            words (np.ndarray): uint32 message words shaped (n_blocks, 16, lanes).
+            block_counts (np.ndarray): The number of padded blocks in each lane's message.
+            state (np.ndarray): uint32 state shaped (4, lanes), updated in place.
+        """
+        n_blocks = words.shape[0]
+        lanes = words.shape[2]
+        s32 = np.uint32(32)
+
+        for group in prange((lanes + MD5_MANY_LANE_GROUP - 1) // MD5_MANY_LANE_GROUP):  # pylint: disable=not-an-iterable
+            start = group * MD5_MANY_LANE_GROUP
+            stop = min(start + MD5_MANY_LANE_GROUP, lanes)
+            width = stop - start
+
+            group_blocks = 0
+            for j in range(start, stop):
+                group_blocks = max(group_blocks, block_counts[j])
+            group_blocks = min(group_blocks, n_blocks)
+
+            a = np.empty(width, dtype=np.uint32)
+            b = np.empty(width, dtype=np.uint32)
+            c = np.empty(width, dtype=np.uint32)
+            d = np.empty(width, dtype=np.uint32)
+
+            for blk in range(group_blocks):
+                a[:] = state[0, start:stop]
+                b[:] = state[1, start:stop]
+                c[:] = state[2, start:stop]
+                d[:] = state[3, start:stop]
+
+                for i in range(16):
+                    m = words[blk, i, start:stop]
+                    k = SINE_CONSTANTS_U32[i]
+                    s = ROTATION_AMOUNTS_U32[i]
+                    for j in range(width):
+                        t = np.uint32(a[j] + ((b[j] & c[j]) | (~b[j] & d[j])) + m[j] + k)
+                        a[j] = np.uint32(b[j] + np.uint32((t << s) | (t >> (s32 - s))))
+                    a, b, c, d = d, a, b, c
+
+                for i in range(16, 32):
+                    m = words[blk, (5 * i + 1) % 16, start:stop]
+                    k = SINE_CONSTANTS_U32[i]
+                    s = ROTATION_AMOUNTS_U32[i]
+                    for j in range(width):
+                        t = np.uint32(a[j] + (d[j] & b[j]) + (~d[j] & c[j]) + m[j] + k)
+                        a[j] = np.uint32(b[j] + np.uint32((t << s) | (t >> (s32 - s))))
+                    a, b, c, d = d, a, b, c
+
+                for i in range(32, 48):
+                    m = words[blk, (3 * i + 5) % 16, start:stop]
+                    k = SINE_CONSTANTS_U32[i]
+                    s = ROTATION_AMOUNTS_U32[i]
+                    for j in range(width):
+                        t = np.uint32(a[j] + (b[j] ^ c[j] ^ d[j]) + m[j] + k)
+                        a[j] = np.uint32(b[j] + np.uint32((t << s) | (t >> (s32 - s))))
+                    a, b, c, d = d, a, b, c
+
+                for i in range(48, 64):
+                    m = words[blk, (7 * i) % 16, start:stop]
+                    k = SINE_CONSTANTS_U32[i]
+                    s = ROTATION_AMOUNTS_U32[i]
+                    for j in range(width):
+                        t = np.uint32(a[j] + (c[j] ^ (b[j] | ~d[j])) + m[j] + k)
+                        a[j] = np.uint32(b[j] + np.uint32((t << s) | (t >> (s32 - s))))
+                    a, b, c, d = d, a, b, c
+
+                for j in range(width):
+                    if blk < block_counts[start + j]:
+                        state[0, start + j] = np.uint32(state[0, start + j] + a[j])
+                        state[1, start + j] = np.uint32(state[1, start + j] + b[j])
+                        state[2, start + j] = np.uint32(state[2, start + j] + c[j])
+                        state[3, start + j] = np.uint32(state[3, start + j] + d[j])
+
+
+# Round function templates used by the code emitter, keyed by round band (i // 16).
+# The G template uses the GOpt identity (d & b) | (~d & c) == (d & b) + (~d & c) (the terms have disjoint bits)
+# and is left unparenthesised so both terms are added into the step sum directly instead of materialising G first.
+# The H template reads c ^ d from the rolling temporary h_cd ({h}), which the emitter carries between H steps.
+# The I template is deliberately left as c ^ (b | ~d); unlike F and G it is not a bitwise select, so it has
+# no (x & z) | (y & ~z) form, and ~d is already independent of b.
+UNROLLED_ROUND_FUNCTIONS = (
+    '(({b} & {c}) | (~{b} & {d}))',
+    '({d} & {b}) + (~{d} & {c})',
+    '({b} ^ {h})',
+    '({c} ^ ({b} | ~{d}))',
+)
+
+# The same round functions, used by the code emitter to fold steps whose inputs are known when generating
+UNROLLED_ROUND_VALUES = (
+    lambda b, c, d: ((b & c) | (~b & d)) & 0xFFFFFFFF,
+    lambda b, c, d: ((d & b) | (~d & c)) & 0xFFFFFFFF,
+    lambda b, c, d: b ^ c ^ d,
+    lambda b, c, d: (c ^ (b | ~d)) & 0xFFFFFFFF,
+)
+
+
+def emit_unrolled_steps(words: list, indent: str, known: dict) -> list:  # pylint: disable=too-many-locals,too-many-branches
+    """
+    Emit the source lines for the 64 unrolled MD5 steps, folding values known at generation time.
+
+    Each step is written as straight-line code with its message index, rotation amount and sine
+    constant as literals, and the a, b, c, d register names are rotated by the emitter rather
+    than shuffling values at runtime. Message words given as ints, and registers listed in
+    known, are constants: every part of a step that depends only on constants is evaluated
+    here and folded into the step's literal, and a step made only of constants emits nothing.
+
+    In the H band the c ^ d half of H is carried between steps: after the rotation the next
+    step's c ^ d is this step's b ^ c, which does not depend on the value being computed, so
+    it is worked out before that register is overwritten and H sits one XOR from b.
+
+    Arguments:
+        words (list): The 16 message words, each a source expression (str) or a known value (int).
+        indent (str): The indentation to prefix each emitted line with.
+        known (dict): Known values of the registers ('a', 'b', 'c', 'd') on entry; updated in place
+            to the registers still known after the last step.
+
+    Returns:
+        list: The emitted source lines.
+    """
+    def operand(register: str) -> str:
+        return f'{known[register]:#010x}' if register in known else register
+
+    def rotate(value: int, shift: int) -> int:
+        return ((value << shift) | (value >> (32 - shift))) & 0xFFFFFFFF
+
+    lines = []
+    registers = ['a', 'b', 'c', 'd']
+
     for i in range(64):
-        if 0 <= i <= 15:
-            f = (b & c) | (~b & d)
-            g = i
-        elif 16 <= i <= 31:
-            f = (d & b) | (~d & c)
-            g = (5 * i + 1) % 16
-        elif 32 <= i <= 47:
-            f = b ^ c ^ d
-            g = (3 * i + 5) % 16
+        ra, rb, rc, rd = registers
+        band = i // 16
+        g = (i, 5 * i + 1, 3 * i + 5, 7 * i)[band] % 16
+        s = ROTATION_AMOUNTS[i]
+        registers = [rd, ra, rb, rc]
+
+        if i == 32:
+            if rc in known and rd in known:
+                known['h_cd'] = known[rc] ^ known[rd]
+            else:
+                lines.append(f'{indent}h_cd = {operand(rc)} ^ {operand(rd)}')
+
+        # Split the step sum into runtime terms and a single folded constant
+        terms = []
+        constant = SINE_CONSTANTS[i]
+        if ra in known:
+            constant += known[ra]
+        else:
+            terms.append(ra)
+        if rb in known and rc in known and rd in known:
+            constant += UNROLLED_ROUND_VALUES[band](known[rb], known[rc], known[rd])
         else:
-            f = c ^ (b | ~d)
-            g = (7 * i) % 16
+            terms.append(UNROLLED_ROUND_FUNCTIONS[band].format(b=operand(rb), c=operand(rc), d=operand(rd), h=operand('h_cd')))
+        if isinstance(words[g], int):
+            constant += words[g]
+        else:
+            terms.append(words[g])
+        constant &= 0xFFFFFFFF
 
-        temp = (a + f + message_schedule[g] + SINE_CONSTANTS[i]) & 0xFFFFFFFF
-        a, d, c, b = d, (b + left_rotate(temp, ROTATION_AMOUNTS[i])) & 0xFFFFFFFF, b, c
+        if terms:
+            lines.append(f"{indent}t = ({' + '.join(terms)} + {constant:#010x}) & 0xFFFFFFFF")
+            rotated = f'(((t << {s}) | (t >> {32 - s})) & 0xFFFFFFFF)'
+        else:
+            rotated = f'{rotate(constant, s):#010x}'
 
-    return (state_a + a) & 0xFFFFFFFF, (state_b + b) & 0xFFFFFFFF, (state_c + c) & 0xFFFFFFFF, (state_d + d) & 0xFFFFFFFF
+        if 32 <= i < 47:
+            if rb in known and rc in known:
+                known['h_cd'] = known[rb] ^ known[rc]
+            else:
+                known.pop('h_cd', None)
+                lines.append(f'{indent}h_cd = {operand(rb)} ^ {operand(rc)}')
+
+        if not terms and rb in known:
+            known[ra] = (known[rb] + rotate(constant, s)) & 0xFFFFFFFF
+        else:
+            known.pop(ra, None)
+            lines.append(f'{indent}{ra} = ({operand(rb)} + {rotated}) & 0xFFFFFFFF')
+
+    known.pop('h_cd', None)
+    return lines
+
+
+def generate_unrolled_compress_source(name: str = '_md5_compress_unrolled', words_array: bool = False) -> str:
+    """
+    Generate the Python source for a fully unrolled MD5 compression function.
+
+    Every one of the 64 steps is emitted by emit_unrolled_steps() as straight-line code, so the
+    generated function contains no loop, branches, modulo operations or table lookups.
+
+    The generated function takes the 16 message words followed by the current state
+    (m0, ..., m15, a, b, c, d) and returns the updated state as a tuple. With words_array set
+    it instead takes a (n_blocks, 16) uint32 array of message words, as produced by
+    np.frombuffer(data, dtype='<u4').reshape(-1, 16), followed by the state, and compresses
+    every row in turn; this form is meant to be compiled by numba.
+
+    Arguments:
+        name (str): The name to give the generated function.
+        words_array (bool): Flag to generate the variant taking an array of message blocks.
+
+    Returns:
+        str: The source code of the generated function.
+    """
+    if words_array:
+        indent = ' ' * 8
+        words = [f'M[{g}]' for g in range(16)]
+        lines = [
+            f'def {name}(words, state_a, state_b, state_c, state_d):',
+            '    for block in range(words.shape[0]):',
+            '        M = words[block]',
+        ]
+    else:
+        indent = ' ' * 4
+        words = [f'm{g}' for g in range(16)]
+        lines = [f"def {name}({', '.join(words)}, state_a, state_b, state_c, state_d):"]
+
+    lines.append(f'{indent}a, b, c, d = state_a, state_b, state_c, state_d')
+    lines += emit_unrolled_steps(words, indent, {})
+
+    if words_array:
+        lines += [f'{indent}state_{r} = (state_{r} + {r}) & 0xFFFFFFFF' for r in 'abcd']
+        lines.append('    return state_a, state_b, state_c, state_d')
+    else:
+        lines.append('    return ((state_a + a) & 0xFFFFFFFF, (state_b + b) & 0xFFFFFFFF, (state_c + c) & 0xFFFFFFFF, (state_d + d) & 0xFFFFFFFF)')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_fixed_length_source(length: int, name: str = 'md5_fixed_length') -> str:
+    """
+    Generate the Python source for an MD5 function specialised to one message length.
+
+    A message of fewer than 56 bytes pads to a single block whose layout is known in advance:
+    only its first ceil(length / 4) words carry message bytes, and the rest (the 0x80 marker,
+    zero padding and bit length) are constants. The initial state is constant as well, so
+    emit_unrolled_steps() folds everything that does not depend on the message, and the
+    generated function unpacks the message words, runs what is left of the 64 steps and
+    returns the hexadecimal digest directly.
+
+    The generated function takes exactly length bytes and expects unpack (a struct unpack
+    for the message words) and pack (the '<4I' digest struct pack) in its globals.
+
+    Arguments:
+        length (int): The message length in bytes (0 to 55).
+        name (str): The name to give the generated function.
+
+    Returns:
+        str: The source code of the generated function.
+
+    Raises:
+        MD5Exception: If the length does not fit in a single padded block.
+    """
+    if not 0 <= length < 56:
+        raise MD5Exception("Fixed-length MD5 functions support message lengths of 0 to 55 bytes.")
+
+    template = MESSAGE_STRUCT.unpack(apply_md5_padding(bytes(length), length))
+    message_words = (length + 3) // 4
+    # The 0x80 marker (and zeros) completing the last word that holds message bytes
+    tail_padding = b'\x80\x00\x00\x00'[:4 * message_words - length]
+
+    words = [f'm{g}' if g < message_words else template[g] for g in range(16)]
+    initial = dict(zip('abcd', (INITIAL_STATE_A, INITIAL_STATE_B, INITIAL_STATE_C, INITIAL_STATE_D)))
+    known = dict(initial)
+
+    lines = [f'def {name}(data):']
+    if message_words:
+        lines.append(f"    {', '.join(words[:message_words])}, = unpack(data + {tail_padding!r})")
+    lines += emit_unrolled_steps(words, '    ', known)
+
+    if len(known) == 4:
+        digest = struct.pack('<4I', *((initial[r] + known[r]) & 0xFFFFFFFF for r in 'abcd')).hex()
+        lines.append(f'    return {digest!r}')
+    else:
+        results = ', '.join(f'{(initial[r] + known[r]) & 0xFFFFFFFF:#010x}' if r in known else f'({initial[r]:#010x} + {r}) & 0xFFFFFFFF' for r in 'abcd')
+        lines.append(f'    return pack({results}).hex()')
+    return '\n'.join(lines) + '\n'
+
+
+# Build the unrolled compression function at import time (the source is generated from constants only)
+_unrolled_namespace: dict = {}
+exec(generate_unrolled_compress_source(), _unrolled_namespace)  # nosec B102  # pylint: disable=exec-used
+_md5_compress_unrolled = _unrolled_namespace['_md5_compress_unrolled']
+
+if HAVE_NUMBA:
+    # Block-array variant: under numba each M[g] is a plain load from the contiguous uint32 words
+    exec(generate_unrolled_compress_source('_md5_compress_words', words_array=True), _unrolled_namespace)  # nosec B102  # pylint: disable=exec-used
+    _md5_compress_words_jit = njit(_unrolled_namespace['_md5_compress_words'])
+
+
+def get_chunk_compressor():
+    """
+    Select the fastest available function for compressing a 64-byte chunk.
+
+    This is the compiled _md5_ext extension when it is available and the unrolled compression
+    function otherwise. Either has the signature of process_md5_chunk:
+    (chunk, state_a, state_b, state_c, state_d) -> state.
+
+    Returns:
+        Callable[[bytes, int, int, int, int], tuple[int, int, int, int]]: The compression function.
+    """
+    if HAVE_MD5_EXT:
+        return md5_ext_compress
+
+    unrolled = _md5_compress_unrolled
+    unpack = MESSAGE_STRUCT.unpack_from
+
+    def compress(chunk: memoryview, state_a: int, state_b: int, state_c: int, state_d: int) -> tuple[int, int, int, int]:
+        return unrolled(*unpack(chunk), state_a, state_b, state_c, state_d)
+
+    return compress
+
+
+def compress_blocks(data: bytes, state: tuple[int, int, int, int], total_length: int = -1) -> tuple[int, int, int, int]:
+    """
+    Compress every 64-byte block of a buffer, updating the MD5 hash state.
+
+    In order of preference the whole buffer is handed to the _md5_ext extension in one call,
+    or, when numba is available, viewed without copying as a (n_blocks, 16) uint32 array of
+    message words and compressed in a single call to the compiled block-array function, so no
+    Python code runs per block. Otherwise each block is handed to the function chosen by
+    get_chunk_compressor() through a zero-copy memoryview.
+
+    Compiling the numba function takes seconds, so it is only used once it has been compiled
+    or when the whole message is at least NUMBA_MIN_LENGTH bytes long; short messages and
+    one-off CLI runs go through the plain unrolled function instead.
+
+    Arguments:
+        data (bytes): The data to compress (any bytes-like object); its length must be a multiple of 64.
+        state (tuple[int, int, int, int]): The current state values (A, B, C, D).
+        total_length (int): Length of the whole message data belongs to; defaults to len(data).
+
+    Returns:
+        tuple[int, int, int, int]: Updated state values (A, B, C, D) after processing every block.
+    """
+    if HAVE_MD5_EXT:
+        return md5_ext_compress_blocks(data, *state)
+
+    if total_length < 0:
+        total_length = len(data)
+
+    if HAVE_NUMBA and (total_length >= NUMBA_MIN_LENGTH or _md5_compress_words_jit.signatures):  # pylint: disable=possibly-used-before-assignment
+        # Always pass a read-only view: numba compiles a separate version for writable arrays (e.g. from a bytearray)
+        return _md5_compress_words_jit(np.frombuffer(memoryview(data).toreadonly(), dtype='<u4').reshape(-1, 16), *state)
+
+    compress = get_chunk_compressor()
+    view = memoryview(data)
+    for i in range(0, len(view), 64):
+        state = compress(view[i:i + 64], *state)
+    return state
 
 
 def apply_md5_padding(data: bytes, original_length: int) -> bytes:
@@ -120,39 +569,265 @@ def apply_md5_padding(data: bytes, original_length: int) -> bytes:
     """
     padded_data = bytearray(data)
     padded_data.append(0x80)  # Append the bit '1' as per MD5 padding requirements
-    while len(padded_data) % 64 != 56:
-        padded_data.append(0)  # Append '0' bits
+    padded_data += bytes((56 - len(padded_data)) % 64)  # Append '0' bits up to 56 bytes mod 64
 
-    padded_data += struct.pack('<Q', original_length * 8)
+    padded_data += struct.pack('<Q', (original_length * 8) & 0xFFFFFFFFFFFFFFFF)
     return bytes(padded_data)
 
 
-def read_file_in_chunks(file_path: str) -> Generator[bytes, None, None]:
+def open_uring():
     """
-    Read a file in 64-byte chunks, yielding each chunk for processing.
+    Create an io_uring instance for reading files, if io_uring is usable here.
 
-    Reads through the file in chunks of 64 bytes (512 bits) and yields each chunk
-    for processing, along with the total length of the file.
+    Returns:
+        liburing.Ring | None: An initialised ring of URING_QUEUE_DEPTH entries, or None when the liburing
+        bindings are not installed or the kernel does not support io_uring (non-Linux, Linux < 5.1, or
+        io_uring disabled).
+    """
+    if not HAVE_LIBURING:
+        return None
+
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(URING_QUEUE_DEPTH, ring)
+    except OSError:
+        return None
+    return ring
+
+
+def read_file_blocks_uring(ring, fd: int, file_size: int) -> Generator[memoryview, None, tuple[bytes, int]]:  # pylint: disable=too-many-locals
+    """
+    Read the first file_size bytes of a file through io_uring, yielding its full 64-byte blocks.
+
+    URING_QUEUE_DEPTH reads of URING_BUFFER_SIZE bytes are kept in flight at increasing offsets, so the
+    kernel is already filling the next buffers while the current one is being hashed. Completions may
+    arrive out of order, but buffers are consumed strictly in file order. Block n always uses buffer
+    n % URING_QUEUE_DEPTH, so it is only submitted once block n - URING_QUEUE_DEPTH has been copied out
+    of that buffer; a read that has completed but not been consumed still owns its buffer. A short
+    read is completed with os.pread.
 
     Arguments:
-        file_path (str): The path to the file to be read.
+        ring (liburing.Ring): A ring created by open_uring().
+        fd (int): The open file descriptor to read from.
+        file_size (int): The number of bytes to read.
 
     Yields:
-        tuple[bytes, int]: Each chunk of data and the total file length.
+        memoryview: A zero-copy view of the full 64-byte blocks of each read buffer (a multiple of 64 bytes).
+
+    Returns:
+        tuple[bytes, int]: The trailing partial chunk and the number of bytes read.
     """
-    total_length = 0
-    last_chunk = b''
-    with open(file_path, 'rb') as file:
-        while True:
-            chunk = file.read(64)
-            chunk_length = len(chunk)
-            total_length += chunk_length
+    cqe = liburing.Cqe()
+    buffers = [bytearray(URING_BUFFER_SIZE) for _ in range(URING_QUEUE_DEPTH)]
+    block_count = (file_size + URING_BUFFER_SIZE - 1) // URING_BUFFER_SIZE
+    completed: dict = {}
+    submitted = 0
+    consumed = 0
+    in_flight = 0
+
+    def submit_reads() -> None:
+        nonlocal submitted, in_flight
+        # Only buffers whose block has been copied out are free, whether or not their read is still in flight
+        while submitted < block_count and submitted < consumed + URING_QUEUE_DEPTH:
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buffers[submitted % URING_QUEUE_DEPTH], submitted * URING_BUFFER_SIZE)
+            liburing.io_uring_sqe_set_data64(sqe, submitted)
+            submitted += 1
+            in_flight += 1
+        liburing.io_uring_submit(ring)
+
+    def wait_for_completion() -> None:
+        nonlocal in_flight
+        liburing.io_uring_wait_cqe(ring, cqe)
+        entry = cqe[0]
+        completed[entry.user_data] = entry.res
+        liburing.io_uring_cq_advance(ring, 1)
+        in_flight -= 1
+
+    carry = b''
+    try:
+        submit_reads()
+        for block in range(block_count):
+            while block not in completed:
+                wait_for_completion()
+
+            offset = block * URING_BUFFER_SIZE
+            expected = min(URING_BUFFER_SIZE, file_size - offset)
+            read_length = liburing.trap_error(completed.pop(block))
+            buffer = carry + bytes(memoryview(buffers[block % URING_QUEUE_DEPTH])[:read_length])
+
+            while read_length < expected:
+                remainder = os.pread(fd, expected - read_length, offset + read_length)
+                if not remainder:
+                    raise MD5Exception("File was truncated while it was being read.")
+                buffer += remainder
+                read_length += len(remainder)
+
+            # The buffer has been copied out, so it can be refilled while this block is hashed
+            consumed = block + 1
+            submit_reads()
+
+            full_length = len(buffer) - len(buffer) % 64
+            yield memoryview(buffer)[:full_length]
+            carry = buffer[full_length:]
+    finally:
+        # The kernel may still be writing into the buffers, so wait for every outstanding read
+        while in_flight:
+            wait_for_completion()
+
+    return carry, file_size
+
+
+class FileChunkReader:
+    """
+    Read a file as full 64-byte MD5 blocks, keeping the trailing partial chunk aside for padding.
+
+    The file is read from a raw file descriptor FILE_READ_SIZE bytes at a time (with sequential
+    read-ahead advised where supported), carrying any remainder over to the next read. When
+    io_uring is available the file, up to its size when opened, is read by read_file_blocks_uring()
+    instead, overlapping the disk reads with hashing; anything after that (e.g. data appended
+    meanwhile) is read as above.
+
+    The full blocks are iterated with blocks() (a multiple of 64 bytes per read) or chunks()
+    (one 64-byte chunk at a time); once they have been consumed, finalize() returns the trailing
+    partial chunk and the total file length.
+
+    Example:
+        with FileChunkReader(path) as reader:
+            for chunk in reader.chunks():
+                ...
+            tail, total_length = reader.finalize()
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Prepare to read a file.
+
+        Arguments:
+            file_path (str): The path to the file to be read.
+        """
+        self.file_path = file_path
+        self.fd = -1
+        self.tail = b''
+        self.total_length = 0
+        self.finished = False
+
+    def __enter__(self) -> 'FileChunkReader':
+        """
+        Open the file for reading.
+
+        Returns:
+            FileChunkReader: The reader itself.
+        """
+        self.fd = os.open(self.file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(self.fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the file."""
+        os.close(self.fd)
+        self.fd = -1
+
+    def blocks(self) -> Generator[memoryview, None, None]:
+        """
+        Read the file, yielding its full 64-byte blocks a read buffer at a time.
+
+        Yields:
+            memoryview: A zero-copy view of the full blocks of each read (a multiple of 64 bytes).
+        """
+        carry = b''
+        total_length = 0
+
+        ring = open_uring()
+        if ring is not None:
+            try:
+                carry, total_length = yield from read_file_blocks_uring(ring, self.fd, os.fstat(self.fd).st_size)
+            finally:
+                liburing.io_uring_queue_exit(ring)
+            os.lseek(self.fd, total_length, os.SEEK_SET)
 
-            if chunk_length < 64:
-                last_chunk = chunk
+        while True:
+            buffer = os.read(self.fd, FILE_READ_SIZE)
+            if not buffer:
                 break
-            yield chunk
-    yield last_chunk, total_length
+
+            total_length += len(buffer)
+            if carry:
+                buffer = carry + buffer
+
+            full_length = len(buffer) - len(buffer) % 64
+            yield memoryview(buffer)[:full_length]
+            carry = buffer[full_length:]
+
+        self.tail, self.total_length, self.finished = carry, total_length, True
+
+    def chunks(self) -> Generator[memoryview, None, None]:
+        """
+        Read the file, yielding each full 64-byte chunk.
+
+        Yields:
+            memoryview: A zero-copy view of each full 64-byte chunk of the file.
+        """
+        for block in self.blocks():
+            for i in range(0, len(block), 64):
+                yield block[i:i + 64]
+
+    def finalize(self) -> tuple[bytes, int]:
+        """
+        Return what is left once every full chunk has been read.
+
+        Returns:
+            tuple[bytes, int]: The trailing partial chunk (possibly empty) and the total file length.
+
+        Raises:
+            MD5Exception: If the file has not been read to the end yet.
+        """
+        if not self.finished:
+            raise MD5Exception("finalize() called before the whole file was read.")
+        return self.tail, self.total_length
+
+
+def read_file_in_chunks(file_path: str) -> Generator[memoryview, None, tuple[bytes, int]]:
+    """
+    Read a file in 64-byte chunks, yielding each full chunk for processing.
+
+    This is a generator front end to FileChunkReader. The trailing partial chunk (possibly
+    empty) and the total length of the file are not yielded; they are the generator's return
+    value, available as StopIteration.value or as the result of 'yield from'.
+
+    Arguments:
+        file_path (str): The path to the file to be read.
+
+    Yields:
+        memoryview: A zero-copy view of each full 64-byte chunk of the file.
+
+    Returns:
+        tuple[bytes, int]: The trailing partial chunk and the total file length.
+    """
+    with FileChunkReader(file_path) as reader:
+        yield from reader.chunks()
+        return reader.finalize()
+
+
+def ensure_bytes(input_data: Union[str, bytes]) -> bytes:
+    """
+    Convert string input to bytes, rejecting unsupported input types.
+
+    Arguments:
+        input_data (Union[str, bytes]): The string or byte data to be hashed.
+
+    Returns:
+        bytes: The input as bytes (strings are UTF-8 encoded).
+
+    Raises:
+        MD5Exception: If an invalid input type is provided.
+    """
+    if isinstance(input_data, str):
+        return input_data.encode('utf-8')
+    if not isinstance(input_data, (bytes, bytearray)):
+        raise MD5Exception("Invalid input type; expected str, bytes, or bytearray.")
+    return input_data
 
 
 def process_data(input_data: Union[str, bytes], is_file: bool = False) -> bytes:
@@ -160,7 +835,8 @@ def process_data(input_data: Union[str, bytes], is_file: bool = False) -> bytes:
     Process input data and return padded data for MD5 hashing.
 
     Handles both file and string inputs by reading the data, applying the MD5-specific
-    padding, and returning the padded data ready for processing.
+    padding, and returning the padded data ready for processing. A file is read whole
+    through FileChunkReader; md5() does not use this path and streams files instead.
 
     Arguments:
         input_data (Union[str, bytes]): The data to be processed, which could be a string or file path.
@@ -177,37 +853,69 @@ def process_data(input_data: Union[str, bytes], is_file: bool = False) -> bytes:
         if not os.path.isfile(input_data):
             raise FileNotFoundError(f"File not found: {input_data}")
 
+        # The reader may reuse its buffers, so copy each block as it arrives
         padded_data = bytearray()
-        total_length = 0
+        with FileChunkReader(input_data) as reader:
+            for block in reader.blocks():
+                padded_data += block
+            tail, total_length = reader.finalize()
+        padded_data += apply_md5_padding(tail, total_length)
+        return bytes(padded_data)
 
-        for chunk in read_file_in_chunks(input_data):
-            if isinstance(chunk, tuple):
-                last_chunk, total_length = chunk
-                padded_data += apply_md5_padding(last_chunk, total_length)
-            else:
-                padded_data += chunk
+    input_data = ensure_bytes(input_data)
+    return apply_md5_padding(input_data, len(input_data))
 
-        return bytes(padded_data)
 
-    if isinstance(input_data, str):
-        input_data = bytearray(input_data, 'utf-8')
-    elif not isinstance(input_data, (bytes, bytearray)):
-        raise MD5Exception("Invalid input type; expected str, bytes, or bytearray.")
+def hashlib_md5(input_data: Union[str, bytes], is_file: bool = False) -> str:
+    """
+    Generate an MD5 hash for a given string or file using hashlib.
+
+    This hands the work to the standard library's (usually OpenSSL) MD5 implementation,
+    streaming files through it in HASHLIB_READ_SIZE blocks. It accepts the same inputs and
+    raises the same errors as md5().
 
-    total_length = len(input_data)
-    return apply_md5_padding(input_data, total_length)
+    Arguments:
+        input_data (Union[str, bytes]): The input string, file path, or byte data.
+        is_file (bool): Flag to indicate whether the input_data is a file path.
 
+    Returns:
+        str: The MD5 hash in hexadecimal format.
 
-def md5(input_data: Union[str, bytes], is_file: bool = False) -> str:
+    Raises:
+        MD5Exception: If an invalid input type is provided.
+        FileNotFoundError: If the specified file does not exist.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+
+    if is_file:
+        if not os.path.isfile(input_data):
+            raise FileNotFoundError(f"File not found: {input_data}")
+
+        with open(input_data, 'rb') as file:
+            for block in iter(lambda: file.read(HASHLIB_READ_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    digest.update(ensure_bytes(input_data))
+    return digest.hexdigest()
+
+
+def md5(input_data: Union[str, bytes], is_file: bool = False, fast: bool = False) -> str:
     """
     Generate an MD5 hash for a given string or file.
 
     This function calculates the MD5 hash of the provided data by processing each 64-byte chunk
     of the input, updating the MD5 state, and then formatting the final hash in hexadecimal.
+    Full chunks are compressed as they are read, so a file is never held in memory; only the
+    final partial chunk is padded, yielding the last one or two blocks.
+
+    If fast is set, or the MD5_USE_HASHLIB environment variable is set to a non-empty value,
+    the pure-Python implementation is skipped and the hash is computed by hashlib_md5() instead.
 
     Arguments:
         input_data (Union[str, bytes]): The input string, file path, or byte data.
         is_file (bool): Flag to indicate whether the input_data is a file path.
+        fast (bool): Flag to use the hashlib backend instead of this implementation.
 
     Returns:
         str: The MD5 hash in hexadecimal format.
@@ -216,17 +924,151 @@ def md5(input_data: Union[str, bytes], is_file: bool = False) -> str:
         MD5Exception: If an error occurs during hashing.
         FileNotFoundError: If the specified file does not exist.
     """
+    if fast or os.environ.get(HASHLIB_ENV_VAR):
+        return hashlib_md5(input_data, is_file=is_file)
+
     # Initial state values for MD5
-    state_a, state_b, state_c, state_d = INITIAL_STATE_A, INITIAL_STATE_B, INITIAL_STATE_C, INITIAL_STATE_D
+    state = (INITIAL_STATE_A, INITIAL_STATE_B, INITIAL_STATE_C, INITIAL_STATE_D)
+
+    if is_file:
+        if not os.path.isfile(input_data):
+            raise FileNotFoundError(f"File not found: {input_data}")
+
+        # Compress the full 64-byte chunks of each read as it arrives
+        file_size = os.path.getsize(input_data)
+        with FileChunkReader(input_data) as reader:
+            for block in reader.blocks():
+                state = compress_blocks(block, state, file_size)
+            tail, total_length = reader.finalize()
+    else:
+        data = ensure_bytes(input_data)
+        total_length = len(data)
+        full_length = total_length - total_length % 64
+
+        # Compress every full 64-byte chunk of the in-memory data in one pass
+        state = compress_blocks(memoryview(data)[:full_length], state)
+        tail = data[full_length:]
+
+    # Pad the trailing partial chunk and compress the resulting one or two blocks
+    state = compress_blocks(apply_md5_padding(tail, total_length), state, total_length)
+
+    return format_md5(*state)
+
+
+def md5_many(buffers: List[Union[str, bytes]]) -> List[str]:
+    """
+    Generate MD5 hashes for many independent strings or byte buffers.
+
+    A single MD5 stream is inherently serial, but independent messages can be hashed in
+    lockstep. When numba is available the inputs are sorted by padded size, grouped into
+    batches of similar block counts, copied into a (n_blocks, 16, lanes) uint32 matrix per
+    batch and compressed lane-parallel by _md5_compress_lanes; otherwise each input is
+    hashed with md5() in turn.
+
+    A batch holds at most MD5_MANY_BATCH_SIZE messages, and its longest message has at most
+    MD5_MANY_MAX_PADDING_RATIO times the blocks of its shortest, so one long outlier gets a
+    batch of its own instead of inflating every other lane to its length.
+
+    As with md5(), setting the MD5_USE_HASHLIB environment variable to a non-empty value hashes
+    every input with hashlib_md5() instead, whether or not numba is available.
+
+    Arguments:
+        buffers (List[Union[str, bytes]]): The input strings or byte data.
+
+    Returns:
+        List[str]: The MD5 hashes in hexadecimal format, in the same order as the inputs.
+
+    Raises:
+        MD5Exception: If any input is of an invalid type.
+    """
+    if os.environ.get(HASHLIB_ENV_VAR):
+        return [hashlib_md5(buffer) for buffer in buffers]
+
+    if not HAVE_NUMBA:
+        return [md5(buffer) for buffer in buffers]
+
+    padded = [process_data(buffer) for buffer in buffers]
+    order = sorted(range(len(padded)), key=lambda index: len(padded[index]))
+    results = [''] * len(padded)
+
+    batches: List[List[int]] = []
+    batch_min_blocks = 0
+    for index in order:
+        n_blocks = len(padded[index]) // 64
+        if not batches or len(batches[-1]) == MD5_MANY_BATCH_SIZE or n_blocks > MD5_MANY_MAX_PADDING_RATIO * batch_min_blocks:
+            batches.append([])
+            batch_min_blocks = n_blocks
+        batches[-1].append(index)
 
-    # Process and pad the data
-    padded_data = process_data(input_data, is_file=is_file)
+    for batch in batches:
+        lanes = len(batch)
+        n_blocks = len(padded[batch[-1]]) // 64
 
-    # Process each 64-byte chunk in the padded data
-    for i in range(0, len(padded_data), 64):
-        state_a, state_b, state_c, state_d = process_md5_chunk(padded_data[i:i + 64], state_a, state_b, state_c, state_d)
+        # Copy each message straight into its lane; the blocks past its end stay zero and are skipped
+        block_counts = np.array([len(padded[index]) // 64 for index in batch], dtype=np.int64)
+        words = np.zeros((n_blocks, 16, lanes), dtype=np.uint32)
+        for lane, index in enumerate(batch):
+            words[:block_counts[lane], :, lane] = np.frombuffer(padded[index], dtype='<u4').reshape(-1, 16)
 
-    return format_md5(state_a, state_b, state_c, state_d)
+        state = np.empty((4, lanes), dtype=np.uint32)
+        state[0], state[1], state[2], state[3] = INITIAL_STATE_A, INITIAL_STATE_B, INITIAL_STATE_C, INITIAL_STATE_D
+        _md5_compress_lanes(words, block_counts, state)  # pylint: disable=possibly-used-before-assignment
+
+        for lane, index in enumerate(batch):
+            results[index] = format_md5(int(state[0, lane]), int(state[1, lane]), int(state[2, lane]), int(state[3, lane]))
+
+    return results
+
+
+@functools.lru_cache(maxsize=None)
+def make_md5_fixed_len(n: int) -> Callable[[bytes], str]:
+    """
+    Build (once per length) an MD5 function specialised to messages of exactly n bytes.
+
+    The function is generated by generate_fixed_length_source(), with the padding and every
+    step that only depends on constants evaluated up front, and returns the hexadecimal digest.
+
+    Arguments:
+        n (int): The message length in bytes (0 to 55).
+
+    Returns:
+        Callable[[bytes], str]: A function hashing a bytes object of exactly n bytes.
+
+    Raises:
+        MD5Exception: If the length does not fit in a single padded block.
+    """
+    if not 0 <= n < 56:
+        raise MD5Exception("Fixed-length MD5 functions support message lengths of 0 to 55 bytes.")
+
+    name = f'md5_len_{n}'
+    namespace = {
+        'unpack': struct.Struct(f'<{(n + 3) // 4}I').unpack,
+        'pack': struct.Struct('<4I').pack,
+    }
+    exec(generate_fixed_length_source(n, name), namespace)  # nosec B102  # pylint: disable=exec-used
+    return namespace[name]
+
+
+def md5_small(input_data: Union[str, bytes]) -> str:
+    """
+    Generate an MD5 hash for a short string or byte buffer.
+
+    Inputs shorter than 56 bytes (a single padded block) are hashed by the function that
+    make_md5_fixed_len() builds for their length; anything longer is passed on to md5().
+
+    Arguments:
+        input_data (Union[str, bytes]): The input string or byte data.
+
+    Returns:
+        str: The MD5 hash in hexadecimal format.
+
+    Raises:
+        MD5Exception: If an invalid input type is provided.
+    """
+    data = ensure_bytes(input_data)
+    if len(data) < 56:
+        return make_md5_fixed_len(len(data))(bytes(data))
+    return md5(data)
 
 
 def format_md5(state_a: int, state_b: int, state_c: int, state_d: int) -> str:
@@ -245,8 +1087,7 @@ def format_md5(state_a: int, state_b: int, state_c: int, state_d: int) -> str:
     Returns:
         str: The MD5 hash in hexadecimal format.
     """
-    digest = struct.pack('<4I', state_a, state_b, state_c, state_d)
-    return ''.join(f'{byte:02x}' for byte in digest)  # noqa
+    return struct.pack('<4I', state_a, state_b, state_c, state_d).hex()
 
 
 def main():
@@ -254,11 +1095,12 @@ def main():
     parser = argparse.ArgumentParser(description="MD5 hash generator for strings and files.")
     parser.add_argument("input", type=str, help="The input string or file path to hash.")
     parser.add_argument("-f", "--file", action="store_true", help="Specify if the input is a file.")
+    parser.add_argument("--fast", action="store_true", help="Use the hashlib (OpenSSL) backend instead of the pure-Python implementation.")
 
     args = parser.parse_args()
 
     try:
-        result = md5(args.input, is_file=args.file)
+        result = md5(args.input, is_file=args.file, fast=args.fast)
         print(f"MD5 Hash: {result}")
     except MD5Exception as e:
         print(f"Error: {e}")
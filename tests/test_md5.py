@@ -0,0 +1,479 @@
+"""
+test_md5.py.
+
+Known-answer and cross-check tests for md5.py.
+
+Every hashing entry point, and the compression functions behind it, is compared with hashlib for all
+lengths from 0 to 130 bytes and for lengths either side of the 64-byte block, the 56-byte padding
+boundary and the file reader buffer sizes. Run from the repository root with:
+
+    python -m unittest discover -s tests
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import md5  # noqa: E402  # pylint: disable=wrong-import-position,import-error
+
+
+# RFC 1321, appendix A.5
+RFC_1321_VECTORS = (
+    (b'', 'd41d8cd98f00b204e9800998ecf8427e'),
+    (b'a', '0cc175b9c0f1b6a831c399e269772661'),
+    (b'abc', '900150983cd24fb0d6963f7d28e17f72'),
+    (b'message digest', 'f96b697d7cb7938d525a2f31aaf161d0'),
+    (b'abcdefghijklmnopqrstuvwxyz', 'c3fcd3d76192e4007dfb496cca67e13b'),
+    (b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789', 'd174ab98d277d9f5a5611c2c9f419d9f'),
+    (b'1234567890' * 8, '57edf4a22be3c955ac49da2e2107b67a'),
+)
+
+# Lengths 0 to 130 cover the empty message, one and two padded blocks, and the 55/56 and 63/64/65 byte edges
+SHORT_LENGTHS = tuple(range(131))
+
+# The file tests shrink the reader buffers so every boundary is reached with little data; the os.read
+# size is deliberately not a multiple of 64, so reads also end part-way through a block
+TEST_FILE_READ_SIZE = 1000
+TEST_URING_BUFFER_SIZE = 4096
+READER_SIZES = {'FILE_READ_SIZE': md5.FILE_READ_SIZE, 'URING_BUFFER_SIZE': md5.URING_BUFFER_SIZE}
+
+# Lengths either side of the (shrunk) read buffer sizes and of a full and over-full io_uring queue
+BOUNDARY_LENGTHS = tuple(sorted({
+    base + delta
+    for base in (TEST_FILE_READ_SIZE, 2 * TEST_FILE_READ_SIZE, TEST_URING_BUFFER_SIZE,
+                 TEST_URING_BUFFER_SIZE * md5.URING_QUEUE_DEPTH, TEST_URING_BUFFER_SIZE * 12)
+    for delta in (-65, -64, -63, -1, 0, 1, 55, 56, 63, 64, 65, 100)
+}))
+
+
+def sample(length: int) -> bytes:
+    """
+    Build a deterministic, non-repeating message of the given length.
+
+    Arguments:
+        length (int): The message length in bytes.
+
+    Returns:
+        bytes: The message.
+    """
+    return bytes((i * 131 + (i >> 8) * 7 + 3) & 0xFF for i in range(length))
+
+
+def expected(data: bytes) -> str:
+    """
+    Return the hashlib MD5 digest of data.
+
+    Arguments:
+        data (bytes): The message.
+
+    Returns:
+        str: The MD5 hash in hexadecimal format.
+    """
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+def backends() -> list:
+    """
+    List the compression backends available here, as patches selecting each one in turn.
+
+    Returns:
+        list: (name, patches) pairs, where patches is a list of mock.patch.object patchers.
+    """
+    choices = [('unrolled', [mock.patch.object(md5, 'HAVE_MD5_EXT', False), mock.patch.object(md5, 'HAVE_NUMBA', False)])]
+    if md5.HAVE_NUMBA:
+        choices.append(('numba', [mock.patch.object(md5, 'HAVE_MD5_EXT', False), mock.patch.object(md5, 'NUMBA_MIN_LENGTH', 0)]))
+    if md5.HAVE_MD5_EXT:
+        choices.append(('extension', []))
+    return choices
+
+
+class FakeUring:  # pylint: disable=missing-function-docstring,too-few-public-methods
+    """
+    A stand-in for the liburing module that completes reads newest-first.
+
+    Each read is performed as soon as it is submitted, like a fast kernel would, but the completions
+    are reported in the reverse of submission order, so read_file_blocks_uring() has to cope with
+    every buffer being filled while earlier ones are still waiting to be copied out.
+    """
+
+    class Ring:
+        """The ring: prepared, and submitted but not yet reaped, reads."""
+
+        def __init__(self) -> None:
+            """Start with no reads."""
+            self.prepared: list = []
+            self.submitted: list = []
+
+    class Cqe:
+        """A completion queue entry, filled in by io_uring_wait_cqe()."""
+
+        def __init__(self) -> None:
+            """Start empty."""
+            self.entry = None
+
+        def __getitem__(self, index: int):
+            """
+            Return the current completion.
+
+            Arguments:
+                index (int): Must be 0.
+
+            Returns:
+                types.SimpleNamespace: The completion, with user_data and res attributes.
+            """
+            assert index == 0
+            return self.entry
+
+    class Sqe:
+        """A submission queue entry."""
+
+        def __init__(self) -> None:
+            """Start empty."""
+            self.read = None
+            self.user_data = None
+
+    @staticmethod
+    def io_uring_queue_init(_entries: int, _ring) -> None:
+        pass
+
+    @staticmethod
+    def io_uring_queue_exit(_ring) -> None:
+        pass
+
+    @classmethod
+    def io_uring_get_sqe(cls, ring):
+        sqe = cls.Sqe()
+        ring.prepared.append(sqe)
+        return sqe
+
+    @staticmethod
+    def io_uring_prep_read(sqe, fd: int, buffer: bytearray, offset: int) -> None:
+        sqe.read = (fd, buffer, offset)
+
+    @staticmethod
+    def io_uring_sqe_set_data64(sqe, user_data: int) -> None:
+        sqe.user_data = user_data
+
+    @staticmethod
+    def io_uring_submit(ring) -> None:
+        for sqe in ring.prepared:
+            fd, buffer, offset = sqe.read
+            data = os.pread(fd, len(buffer), offset)
+            buffer[:len(data)] = data
+            ring.submitted.append(types.SimpleNamespace(user_data=sqe.user_data, res=len(data)))
+        ring.prepared.clear()
+
+    @staticmethod
+    def io_uring_wait_cqe(ring, cqe) -> None:
+        cqe.entry = ring.submitted[-1]
+
+    @staticmethod
+    def io_uring_cq_advance(ring, _count: int) -> None:
+        ring.submitted.pop()
+
+    @staticmethod
+    def trap_error(result: int) -> int:
+        if result < 0:
+            raise OSError(-result, os.strerror(-result))
+        return result
+
+
+class BackendTestCase(unittest.TestCase):
+    """Base class running a check once per available compression backend."""
+
+    def for_each_backend(self, check) -> None:
+        """
+        Run check under every available compression backend.
+
+        Arguments:
+            check (Callable[[], None]): The check to run.
+        """
+        for name, patches in backends():
+            with self.subTest(backend=name):
+                for patch in patches:
+                    patch.start()
+                try:
+                    check()
+                finally:
+                    for patch in reversed(patches):
+                        patch.stop()
+
+
+class TestKnownAnswers(unittest.TestCase):
+    """The RFC 1321 test suite."""
+
+    def test_md5(self) -> None:
+        """md5() returns the RFC 1321 digests, for bytes and str input."""
+        for message, digest in RFC_1321_VECTORS:
+            with self.subTest(message=message):
+                self.assertEqual(md5.md5(message), digest)
+                self.assertEqual(md5.md5(message.decode('ascii')), digest)
+
+    def test_fast(self) -> None:
+        """The hashlib fast path agrees with the RFC 1321 digests."""
+        for message, digest in RFC_1321_VECTORS:
+            with self.subTest(message=message):
+                self.assertEqual(md5.md5(message, fast=True), digest)
+
+
+class TestCompression(BackendTestCase):
+    """The compression functions and the padding, driven by hand."""
+
+    def hash_padded(self, compress, data: bytes) -> str:
+        """
+        Hash data by padding it and feeding every 64-byte chunk to a per-chunk compression function.
+
+        Arguments:
+            compress (Callable): A function with the signature of process_md5_chunk.
+            data (bytes): The message.
+
+        Returns:
+            str: The MD5 hash in hexadecimal format.
+        """
+        padded = md5.process_data(data)
+        self.assertEqual(len(padded) % 64, 0)
+        state = (md5.INITIAL_STATE_A, md5.INITIAL_STATE_B, md5.INITIAL_STATE_C, md5.INITIAL_STATE_D)
+        for i in range(0, len(padded), 64):
+            state = compress(padded[i:i + 64], *state)
+        return md5.format_md5(*state)
+
+    def test_process_md5_chunk(self) -> None:
+        """The reference compression function agrees with hashlib."""
+        for length in SHORT_LENGTHS:
+            data = sample(length)
+            self.assertEqual(self.hash_padded(md5.process_md5_chunk, data), expected(data), length)
+
+    def test_chunk_compressor(self) -> None:
+        """get_chunk_compressor() agrees with hashlib under every backend."""
+        def check() -> None:
+            compress = md5.get_chunk_compressor()
+            for length in SHORT_LENGTHS:
+                data = sample(length)
+                self.assertEqual(self.hash_padded(compress, data), expected(data), length)
+
+        self.for_each_backend(check)
+
+    def test_compress_blocks(self) -> None:
+        """compress_blocks() agrees with hashlib for bytes and bytearray input under every backend."""
+        def check() -> None:
+            initial = (md5.INITIAL_STATE_A, md5.INITIAL_STATE_B, md5.INITIAL_STATE_C, md5.INITIAL_STATE_D)
+            for length in SHORT_LENGTHS:
+                data = sample(length)
+                padded = md5.process_data(data)
+                for buffer in (padded, bytearray(padded), memoryview(padded)):
+                    state = md5.compress_blocks(buffer, initial)
+                    self.assertEqual(md5.format_md5(*state), expected(data), length)
+
+        self.for_each_backend(check)
+
+    @unittest.skipUnless(md5.HAVE_NUMBA, 'numba is not installed')
+    def test_compress_blocks_single_compile(self) -> None:
+        """The numba block-array function is compiled once, whatever kind of buffer it is given."""
+        initial = (md5.INITIAL_STATE_A, md5.INITIAL_STATE_B, md5.INITIAL_STATE_C, md5.INITIAL_STATE_D)
+        padded = md5.process_data(b'abc')
+        with mock.patch.object(md5, 'HAVE_MD5_EXT', False), mock.patch.object(md5, 'NUMBA_MIN_LENGTH', 0):
+            for buffer in (padded, bytearray(padded), memoryview(padded), memoryview(bytearray(padded))):
+                md5.compress_blocks(buffer, initial)
+        self.assertEqual(len(md5._md5_compress_words_jit.signatures), 1)  # pylint: disable=protected-access
+
+    def test_padding(self) -> None:
+        """apply_md5_padding() produces a multiple of 64 bytes ending in the 64-bit bit length."""
+        for length in SHORT_LENGTHS:
+            padded = md5.apply_md5_padding(bytes(length), length)
+            self.assertEqual(len(padded), ((length + 8) // 64 + 1) * 64, length)
+            self.assertEqual(padded[length], 0x80, length)
+            self.assertEqual(int.from_bytes(padded[-8:], 'little'), length * 8, length)
+
+
+class TestHashing(BackendTestCase):
+    """The public in-memory hashing functions."""
+
+    def test_md5(self) -> None:
+        """md5() agrees with hashlib for every short length under every backend."""
+        def check() -> None:
+            for length in SHORT_LENGTHS:
+                data = sample(length)
+                self.assertEqual(md5.md5(data), expected(data), length)
+                self.assertEqual(md5.md5(bytearray(data)), expected(data), length)
+
+        self.for_each_backend(check)
+
+    def test_md5_small(self) -> None:
+        """md5_small() agrees with hashlib on both sides of its 56-byte limit."""
+        for length in SHORT_LENGTHS:
+            data = sample(length)
+            self.assertEqual(md5.md5_small(data), expected(data), length)
+
+    def test_make_md5_fixed_len_range(self) -> None:
+        """make_md5_fixed_len() rejects lengths that need more than one padded block."""
+        for length in (-5, -1, 56, 64):
+            with self.subTest(length=length), self.assertRaises(md5.MD5Exception):
+                md5.make_md5_fixed_len(length)
+
+    def test_md5_many(self) -> None:
+        """md5_many() agrees with hashlib, in input order, with and without numba."""
+        inputs = [sample(length) for length in SHORT_LENGTHS] + [sample(length) for length in (1000, 4096, 70000)] + ['straße', b'']
+        inputs += inputs[::-1]
+        digests = [expected(md5.ensure_bytes(data)) for data in inputs]
+
+        self.assertEqual(md5.md5_many(inputs), digests)
+        self.assertEqual(md5.md5_many([]), [])
+        with mock.patch.object(md5, 'HAVE_NUMBA', False):
+            self.assertEqual(md5.md5_many(inputs), digests)
+
+    def test_md5_many_hashlib(self) -> None:
+        """md5_many() follows MD5_USE_HASHLIB with and without numba."""
+        inputs = [sample(length) for length in (0, 3, 64, 1000)]
+        digests = [expected(data) for data in inputs]
+
+        for have_numba in (False, md5.HAVE_NUMBA):
+            with self.subTest(have_numba=have_numba), mock.patch.object(md5, 'HAVE_NUMBA', have_numba), \
+                    mock.patch.dict(os.environ, {md5.HASHLIB_ENV_VAR: '1'}), mock.patch.object(md5, 'hashlib_md5', wraps=md5.hashlib_md5) as hashlib_md5:
+                self.assertEqual(md5.md5_many(inputs), digests)
+                self.assertEqual(hashlib_md5.call_count, len(inputs))
+
+    def test_invalid_input(self) -> None:
+        """Unsupported input types raise MD5Exception."""
+        for function in (md5.md5, md5.md5_small, md5.process_data):
+            with self.subTest(function=function.__name__), self.assertRaises(md5.MD5Exception):
+                function(12345)
+
+
+class TestFiles(BackendTestCase):
+    """The file readers and file hashing."""
+
+    def setUp(self) -> None:
+        """Create a scratch directory and shrink the reader buffers."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        for name, value in (('FILE_READ_SIZE', TEST_FILE_READ_SIZE), ('URING_BUFFER_SIZE', TEST_URING_BUFFER_SIZE)):
+            patch = mock.patch.object(md5, name, value)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self) -> None:
+        """Remove the scratch directory."""
+        self.directory.cleanup()
+
+    def write(self, data: bytes) -> str:
+        """
+        Write data to a scratch file.
+
+        Arguments:
+            data (bytes): The file contents.
+
+        Returns:
+            str: The path of the file.
+        """
+        path = os.path.join(self.directory.name, f'data_{len(data)}.bin')
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def lengths(self):
+        """
+        Yield the file lengths to test: a sample of the short lengths and every boundary length.
+
+        Yields:
+            int: A file length in bytes.
+        """
+        yield from SHORT_LENGTHS[::7]
+        yield from (55, 56, 63, 64, 65, 128)
+        yield from BOUNDARY_LENGTHS
+
+    def test_file_chunk_reader(self) -> None:
+        """FileChunkReader.blocks() and chunks() reassemble the file, with or without io_uring."""
+        uring = [('os.read', mock.patch.object(md5, 'HAVE_LIBURING', False))]
+        if md5.HAVE_LIBURING:
+            uring.append(('io_uring', mock.patch.object(md5, 'HAVE_LIBURING', True)))
+
+        for name, patch in uring:
+            for length in self.lengths():
+                with self.subTest(reader=name, length=length), patch:
+                    data = sample(length)
+                    path = self.write(data)
+
+                    with md5.FileChunkReader(path) as reader:
+                        with self.assertRaises(md5.MD5Exception):
+                            reader.finalize()
+                        blocks = [bytes(block) for block in reader.blocks()]
+                        tail, total_length = reader.finalize()
+                    self.assertTrue(all(len(block) % 64 == 0 for block in blocks))
+                    self.assertEqual(b''.join(blocks) + tail, data)
+                    self.assertEqual(total_length, length)
+
+                    with md5.FileChunkReader(path) as reader:
+                        chunks = [bytes(chunk) for chunk in reader.chunks()]
+                        self.assertEqual(reader.finalize(), (tail, length))
+                    self.assertTrue(all(len(chunk) == 64 for chunk in chunks))
+                    self.assertEqual(b''.join(chunks) + tail, data)
+
+    def test_uring_out_of_order_completions(self) -> None:
+        """read_file_blocks_uring() reassembles the file when reads complete newest-first."""
+        for length in (0, 100, TEST_URING_BUFFER_SIZE * md5.URING_QUEUE_DEPTH, TEST_URING_BUFFER_SIZE * 12 + 100, TEST_URING_BUFFER_SIZE * 30 + 1):
+            with self.subTest(length=length), mock.patch.object(md5, 'HAVE_LIBURING', True), \
+                    mock.patch.object(md5, 'liburing', FakeUring, create=True):
+                data = sample(length)
+                path = self.write(data)
+                with md5.FileChunkReader(path) as reader:
+                    blocks = [bytes(block) for block in reader.blocks()]
+                    tail, total_length = reader.finalize()
+                self.assertEqual(b''.join(blocks) + tail, data)
+                self.assertEqual(total_length, length)
+                self.assertEqual(md5.md5(path, is_file=True), expected(data))
+
+    def test_read_file_in_chunks(self) -> None:
+        """read_file_in_chunks() yields every full chunk and returns the tail and length."""
+        for length in self.lengths():
+            with self.subTest(length=length):
+                data = sample(length)
+                reader = md5.read_file_in_chunks(self.write(data))
+                chunks = []
+                tail, total_length = None, None
+                try:
+                    while True:
+                        chunks.append(bytes(next(reader)))
+                except StopIteration as stop:
+                    tail, total_length = stop.value
+                self.assertEqual(b''.join(chunks) + tail, data)
+                self.assertEqual(total_length, length)
+
+    def test_md5_file(self) -> None:
+        """md5(..., is_file=True) agrees with hashlib under every backend."""
+        def check() -> None:
+            for length in self.lengths():
+                data = sample(length)
+                self.assertEqual(md5.md5(self.write(data), is_file=True), expected(data), length)
+
+        self.for_each_backend(check)
+
+    def test_md5_file_full_buffers(self) -> None:
+        """md5(..., is_file=True) agrees with hashlib with the real reader buffer sizes."""
+        for length in (READER_SIZES['FILE_READ_SIZE'] + 100, READER_SIZES['URING_BUFFER_SIZE'] * 12 + 100):
+            with self.subTest(length=length), mock.patch.multiple(md5, **READER_SIZES):
+                data = sample(length)
+                self.assertEqual(md5.md5(self.write(data), is_file=True), expected(data))
+
+    def test_process_data_file(self) -> None:
+        """process_data(..., is_file=True) pads the file contents like the in-memory path."""
+        for length in (0, 3, 64, 100, TEST_FILE_READ_SIZE + 1, TEST_URING_BUFFER_SIZE * 12 + 1):
+            with self.subTest(length=length):
+                data = sample(length)
+                self.assertEqual(md5.process_data(self.write(data), is_file=True), md5.process_data(data))
+
+    def test_missing_file(self) -> None:
+        """Missing files raise FileNotFoundError."""
+        missing = os.path.join(self.directory.name, 'missing.bin')
+        for function in (md5.md5, md5.hashlib_md5, md5.process_data):
+            with self.subTest(function=function.__name__), self.assertRaises(FileNotFoundError):
+                function(missing, is_file=True)
+
+
+if __name__ == '__main__':
+    unittest.main()